@@ -22,6 +22,9 @@ from weakref import ref as _ref
 from weakref import WeakMethod as _WeakMethod
 
 from itertools import count as _count
+from itertools import islice as _islice
+
+from operator import itemgetter as _itemgetter
 
 __version__ = version = '3.3'
 
@@ -42,8 +45,12 @@ def dispatch_event(name: str, *args: _Any) -> None:
             do not account for them, it will likely result in a
             TypeError or other undefined crash.
     """
-    for func in event_registry.get(name, []):
-        func()(*args)
+    # Iterate over a snapshot, since handlers may be added or
+    # garbage collected while the event is being dispatched:
+    for func in tuple(event_registry.get(name, ())):
+        handler = func()
+        if handler is not None:
+            handler(*args)
 
 
 def _make_callback(name: str) -> _Callable[[_Any], None]:
@@ -135,28 +142,32 @@ _current_world: str = "default"
 _entity_count: "_count[int]" = _count(start=1)
 _components: _Dict[_Type[_Any], _Set[_Any]] = {}
 _entities: _Dict[int, _Dict[_Type[_Any], _Any]] = {}
-_dead_entities: _Set[int] = set()
-_get_component_cache: _Dict[_Type[_Any], _List[_Any]] = {}
-_get_components_cache: _Dict[_Tuple[_Type[_Any], ...], _List[_Any]] = {}
+_dead_entities: _Dict[int, None] = {}
+_get_component_cache: _Dict[_Type[_Any], _Tuple[_Any, ...]] = {}
+_get_components_cache: _Dict[_Tuple[_Type[_Any], ...], _Tuple[_Any, ...]] = {}
+_get_components_cache_index: _Dict[_Type[_Any], _Set[_Tuple[_Type[_Any], ...]]] = {}
 _processors: _List[Processor] = []
+_processors_by_type: _Dict[_Type[Processor], Processor] = {}
 event_registry: _Dict[str, _Any] = {}
 process_times: _Dict[str, int] = {}
 current_world: str = "default"
 
 
-# {context_name: (entity_count, components, entities, dead_entities,
-#                 comp_cache, comps_cache, processors, process_times, event_registry)}
+# {context_name: (entity_count, components, entities, dead_entities, comp_cache, comps_cache,
+#                 comps_cache_index, processors, processors_by_type, process_times, event_registry)}
 _context_map: _Dict[str, _Tuple[
     "_count[int]",
     _Dict[_Type[_Any], _Set[_Any]],
     _Dict[int, _Dict[_Type[_Any], _Any]],
-    _Set[int],
-    _Dict[_Type[_Any], _List[_Any]],
-    _Dict[_Tuple[_Type[_Any], ...], _List[_Any]],
+    _Dict[int, None],
+    _Dict[_Type[_Any], _Tuple[_Any, ...]],
+    _Dict[_Tuple[_Type[_Any], ...], _Tuple[_Any, ...]],
+    _Dict[_Type[_Any], _Set[_Tuple[_Type[_Any], ...]]],
     _List[Processor],
+    _Dict[_Type[Processor], Processor],
     _Dict[str, int],
     _Dict[str, _Any]
-]] = {"default": (_entity_count, {}, {}, set(), {}, {}, [], {}, {})}
+]] = {"default": (_entity_count, {}, {}, {}, {}, {}, {}, [], {}, {}, {})}
 
 
 def clear_cache() -> None:
@@ -167,6 +178,14 @@ def clear_cache() -> None:
     """
     _get_component_cache.clear()
     _get_components_cache.clear()
+    _get_components_cache_index.clear()
+
+
+def _invalidate_cache(component_type: _Type[_Any]) -> None:
+    """Remove only the cached lookups that include this Component type."""
+    _get_component_cache.pop(component_type, None)
+    for component_types in _get_components_cache_index.pop(component_type, ()):
+        _get_components_cache.pop(component_types, None)
 
 
 def clear_database() -> None:
@@ -193,8 +212,22 @@ def add_processor(processor_instance: Processor, priority: int = 0) -> None:
     Processors with higher priority will be called first.
     """
     processor_instance.priority = priority
-    _processors.append(processor_instance)
-    _processors.sort(key=lambda proc: proc.priority, reverse=True)
+    processor_type = type(processor_instance)
+    existing = _processors_by_type.get(processor_type)
+
+    # get_processor returns the instance that is processed first, which
+    # is this one only if it is inserted ahead of the existing instance:
+    if existing is None or existing.priority < priority:
+        _processors_by_type[processor_type] = processor_instance
+
+    # Insert after all Processors of equal or higher priority,
+    # which keeps the list in order without re-sorting it:
+    for index, processor in enumerate(_processors):
+        if processor.priority < priority:
+            _processors.insert(index, processor_instance)
+            break
+    else:
+        _processors.append(processor_instance)
 
 
 def remove_processor(processor_type: _Type[Processor]) -> None:
@@ -209,9 +242,8 @@ def remove_processor(processor_type: _Type[Processor]) -> None:
         self.world.remove_processor(my_processor_instance)
 
     """
-    for processor in _processors:
-        if type(processor) is processor_type:
-            _processors.remove(processor)
+    if _processors_by_type.pop(processor_type, None) is not None:
+        _processors[:] = [proc for proc in _processors if type(proc) is not processor_type]
 
 
 def get_processor(processor_type: _Type[Processor]) -> _Optional[Processor]:
@@ -221,11 +253,7 @@ def get_processor(processor_type: _Type[Processor]) -> _Optional[Processor]:
     useful in certain situations, such as wanting to call a method on a
     Processor, from within another Processor.
     """
-    for processor in _processors:
-        if type(processor) is processor_type:
-            return processor
-    else:
-        return None
+    return _processors_by_type.get(processor_type)
 
 
 def create_entity(*components: _C) -> int:
@@ -237,25 +265,108 @@ def create_entity(*components: _C) -> int:
     added later with the :py:func:`esper.add_component` funcion.
     """
     entity = next(_entity_count)
+    comp_db = _components
 
     if entity not in _entities:
         _entities[entity] = {}
 
+    components_dict = _entities[entity]
+
     for component_instance in components:
 
         component_type = type(component_instance)
 
-        if component_type not in _components:
-            _components[component_type] = set()
+        try:
+            comp_db[component_type].add(entity)
+        except KeyError:
+            comp_db[component_type] = {entity}
 
-        _components[component_type].add(entity)
+        components_dict[component_type] = component_instance
 
-        _entities[entity][component_type] = component_instance
-        clear_cache()
+    for component_type in components_dict:
+        _invalidate_cache(component_type)
 
     return entity
 
 
+def create_entities(number: int, *component_factories: _Callable[[], _Any]) -> range:
+    """Create a batch of new Entities, with optional initial Components.
+
+    This is equivalent to calling :py:func:`esper.create_entity` the
+    given number of times, but the Entity IDs are reserved in one step,
+    and the Component lookup cache is only invalidated once. The IDs are
+    consecutive, and are returned as a `range`.
+
+    Each Entity needs its own Component instances, so Components are
+    passed as factories: callables that return a new instance when called
+    without arguments. A Component class with default values can be
+    passed directly, otherwise a lambda can be used. For example::
+
+        bullets = esper.create_entities(100, Bullet, lambda: Velocity(x=5))
+    """
+    if number < 1:
+        return range(0)
+
+    first = next(_entity_count)
+    # Advance the counter past the remainder of the reserved IDs:
+    next(_islice(_entity_count, number - 1, number - 1), None)
+
+    entities = range(first, first + number)
+    entity_db = _entities
+    comp_db = _components
+    component_types = set()
+
+    # Invalidate even if a factory raises, since the Entities
+    # created before that point are already in the database:
+    try:
+        for entity in entities:
+            components_dict = entity_db[entity] = {}
+
+            for factory in component_factories:
+                component_instance = factory()
+                component_type = type(component_instance)
+
+                try:
+                    comp_db[component_type].add(entity)
+                except KeyError:
+                    comp_db[component_type] = {entity}
+
+                components_dict[component_type] = component_instance
+                component_types.add(component_type)
+    finally:
+        for component_type in component_types:
+            _invalidate_cache(component_type)
+
+    return entities
+
+
+def _remove_entities(entities: _Iterable[int]) -> None:
+    """Remove Entities and their Components from the database.
+
+    Shared by immediate deletion, and the batched removal of dead
+    Entities, so that the per-Entity loop is only in one place. The
+    cache is invalidated once per removed Component type, after the sweep.
+    """
+    entity_db = _entities
+    comp_db = _components
+    component_types = set()
+
+    try:
+        for entity in entities:
+
+            for component_type in entity_db.pop(entity):
+                entity_set = comp_db[component_type]
+                entity_set.discard(entity)
+
+                if not entity_set:
+                    del comp_db[component_type]
+
+                component_types.add(component_type)
+    finally:
+        for component_type in component_types:
+            _invalidate_cache(component_type)
+
+
 def delete_entity(entity: int, immediate: bool = False) -> None:
     """Delete an Entity from the current World.
 
@@ -269,17 +380,10 @@ def delete_entity(entity: int, immediate: bool = False) -> None:
     Raises a KeyError if the given entity does not exist in the database.
     """
     if immediate:
-        for component_type in _entities[entity]:
-            _components[component_type].discard(entity)
-
-            if not _components[component_type]:
-                del _components[component_type]
-
-        del _entities[entity]
-        clear_cache()
+        _remove_entities((entity,))
 
     else:
-        _dead_entities.add(entity)
+        _dead_entities[entity] = None
 
 
 def entity_exists(entity: int) -> bool:
@@ -324,8 +428,7 @@ def has_component(entity: int, component_type: _Type[_C]) -> bool:
 
 def has_components(entity: int, *component_types: _Type[_C]) -> bool:
     """Check if an Entity has all the specified Component types."""
-    components_dict = _entities[entity]
-    return all(comp_type in components_dict for comp_type in component_types)
+    return _entities[entity].keys() >= set(component_types)
 
 
 def add_component(entity: int, component_instance: _C, type_alias: _Optional[_Type[_C]] = None) -> None:
@@ -339,14 +442,15 @@ def add_component(entity: int, component_instance: _C, type_alias: _Optional[_Ty
     later by some common parent type.
     """
     component_type = type_alias or type(component_instance)
+    comp_db = _components
 
-    if component_type not in _components:
-        _components[component_type] = set()
-
-    _components[component_type].add(entity)
+    try:
+        comp_db[component_type].add(entity)
+    except KeyError:
+        comp_db[component_type] = {entity}
 
     _entities[entity][component_type] = component_instance
-    clear_cache()
+    _invalidate_cache(component_type)
 
 
 def remove_component(entity: int, component_type: _Type[_C]) -> _C:
@@ -359,63 +463,89 @@ def remove_component(entity: int, component_type: _Type[_C]) -> _C:
     Raises a KeyError if either the given entity or Component type does
     not exist in the database.
     """
-    _components[component_type].discard(entity)
+    entity_set = _components[component_type]
+    entity_set.discard(entity)
 
-    if not _components[component_type]:
+    if not entity_set:
         del _components[component_type]
 
-    clear_cache()
+    _invalidate_cache(component_type)
     return _entities[entity].pop(component_type)  # type: ignore[no-any-return]
 
 
 def _get_component(component_type: _Type[_C]) -> _Iterable[_Tuple[int, _C]]:
     entity_db = _entities
 
-    for entity in _components.get(component_type, []):
+    for entity in _components.get(component_type, ()):
         yield entity, entity_db[entity][component_type]
 
 
-def _get_components(*component_types: _Type[_C]) -> _Iterable[_Tuple[int, _List[_C]]]:
+def _get_components(*component_types: _Type[_C]) -> _Iterable[_Tuple[int, _Tuple[_C, ...]]]:
+    if len(component_types) == 1:
+        # itemgetter returns a bare value for a single key, rather than a tuple.
+        # Reuse the (possibly cached) single Component query instead:
+        for entity, component in get_component(component_types[0]):
+            yield entity, (component,)
+        return
+
     entity_db = _entities
     comp_db = _components
+    # Fetches all requested Components from an Entity's dict in one C call:
+    get_row = _itemgetter(*component_types)
 
     try:
-        for entity in set.intersection(*[comp_db[ct] for ct in component_types]):
-            yield entity, [entity_db[entity][ct] for ct in component_types]
+        # Start with the smallest set, so the intersection stays small:
+        comp_sets = sorted([comp_db[ct] for ct in component_types], key=len)
     except KeyError:
-        pass
+        # At least one of the Component types is not assigned to any Entity:
+        return
+
+    for entity in comp_sets[0].intersection(*comp_sets[1:]):
+        yield entity, get_row(entity_db[entity])
+
 
+def get_component(component_type: _Type[_C]) -> _Tuple[_Tuple[int, _C], ...]:
+    """Get an iterator for Entity, Component pairs.
 
-def get_component(component_type: _Type[_C]) -> _List[_Tuple[int, _C]]:
-    """Get an iterator for Entity, Component pairs."""
+    The results are cached, and returned as a read-only tuple. The
+    same tuple is returned until the Component type is next added
+    to, or removed from, an Entity.
+    """
     try:
         return _get_component_cache[component_type]
     except KeyError:
-        return _get_component_cache.setdefault(component_type, list(_get_component(component_type)))
+        return _get_component_cache.setdefault(component_type, tuple(_get_component(component_type)))
 
 
 @_overload
-def get_components(__c1: _Type[_C], __c2: _Type[_C2]) -> _List[_Tuple[int, _Tuple[_C, _C2]]]:
+def get_components(__c1: _Type[_C], __c2: _Type[_C2]) -> _Tuple[_Tuple[int, _Tuple[_C, _C2]], ...]:
     ...
 
 
 @_overload
-def get_components(__c1: _Type[_C], __c2: _Type[_C2], __c3: _Type[_C3]) -> _List[_Tuple[int, _Tuple[_C, _C2, _C3]]]:
+def get_components(__c1: _Type[_C], __c2: _Type[_C2], __c3: _Type[_C3]) -> _Tuple[_Tuple[int, _Tuple[_C, _C2, _C3]], ...]:
     ...
 
 
 @_overload
-def get_components(__c1: _Type[_C], __c2: _Type[_C2], __c3: _Type[_C3], __c4: _Type[_C4]) -> _List[
-                   _Tuple[int, _Tuple[_C, _C2, _C3, _C4]]]:
+def get_components(__c1: _Type[_C], __c2: _Type[_C2], __c3: _Type[_C3], __c4: _Type[_C4]) -> _Tuple[
+                   _Tuple[int, _Tuple[_C, _C2, _C3, _C4]], ...]:
     ...
 
 
 def get_components(*component_types: _Type[_Any]) -> _Iterable[_Tuple[int, _Tuple[_Any, ...]]]:
-    """Get an iterator for Entity and multiple Component sets."""
+    """Get an iterator for Entity and multiple Component sets.
+
+    The results are cached, and returned as a read-only tuple. The
+    same tuple is returned until one of the requested Component
+    types is next added to, or removed from, an Entity.
+    """
     try:
         return _get_components_cache[component_types]
     except KeyError:
-        return _get_components_cache.setdefault(component_types, list(_get_components(*component_types)))
+        for component_type in component_types:
+            _get_components_cache_index.setdefault(component_type, set()).add(component_types)
+        return _get_components_cache.setdefault(component_types, tuple(_get_components(*component_types)))
 
 
 def try_component(entity: int, component_type: _Type[_C]) -> _Optional[_C]:
@@ -426,8 +556,9 @@ def try_component(entity: int, component_type: _Type[_C]) -> _Optional[_C]:
     that may or may not exist, without having to first query if the Entity
     has the Component type.
     """
-    if component_type in _entities[entity]:
-        return _entities[entity][component_type]  # type: ignore[no-any-return]
+    components_dict = _entities[entity]
+    if component_type in components_dict:
+        return components_dict[component_type]  # type: ignore[no-any-return]
     return None
 
 
@@ -454,8 +585,9 @@ def try_components(entity: int, *component_types: _Type[_C]) -> _Optional[_Tuple
     that may or may not exist, without first having to query if the Entity
     has the Component types.
     """
-    if all(comp_type in _entities[entity] for comp_type in component_types):
-        return [_entities[entity][comp_type] for comp_type in component_types]  # type: ignore[return-value]
+    components_dict = _entities[entity]
+    if components_dict.keys() >= set(component_types):
+        return [components_dict[comp_type] for comp_type in component_types]  # type: ignore[return-value]
     return None
 
 
@@ -467,21 +599,11 @@ def clear_dead_entities() -> None:
     calling your processors manually, this function should be called in
     your main loop after calling all processors.
     """
-    # In the interest of performance, this function duplicates code from the
-    # `delete_entity` function. If that function is changed, those changes should
-    # be duplicated here as well.
-    for entity in _dead_entities:
-
-        for component_type in _entities[entity]:
-            _components[component_type].discard(entity)
-
-            if not _components[component_type]:
-                del _components[component_type]
-
-        del _entities[entity]
+    if not _dead_entities:
+        return
 
+    _remove_entities(_dead_entities)
     _dead_entities.clear()
-    clear_cache()
 
 
 def process(*args: _Any, **kwargs: _Any) -> None:
@@ -493,7 +615,8 @@ def process(*args: _Any, **kwargs: _Any) -> None:
     at the start of this call.
     """
     clear_dead_entities()
-    for processor in _processors:
+    # Iterate over a snapshot, in case a Processor adds or removes Processors:
+    for processor in tuple(_processors):
         processor.process(*args, **kwargs)
 
 
@@ -506,10 +629,10 @@ def timed_process(*args: _Any, **kwargs: _Any) -> None:
     after each call.
     """
     clear_dead_entities()
-    for processor in _processors:
-        start_time = _time.process_time()
+    for processor in tuple(_processors):
+        start_time = _time.perf_counter_ns()
         processor.process(*args, **kwargs)
-        process_times[processor.__class__.__name__] = int((_time.process_time() - start_time) * 1000)
+        process_times[processor.__class__.__name__] = (_time.perf_counter_ns() - start_time) // 1_000_000
 
 
 def list_worlds() -> _List[str]:
@@ -553,7 +676,7 @@ def switch_world(name: str) -> None:
     """
     if name not in _context_map:
         # Create a new context if the name does not already exist:
-        _context_map[name] = (_count(start=1), {}, {}, set(), {}, {}, [], {}, {})
+        _context_map[name] = (_count(start=1), {}, {}, {}, {}, {}, {}, [], {}, {}, {})
 
     global _current_world
     global _entity_count
@@ -562,12 +685,15 @@ def switch_world(name: str) -> None:
     global _dead_entities
     global _get_component_cache
     global _get_components_cache
+    global _get_components_cache_index
     global _processors
+    global _processors_by_type
     global process_times
     global event_registry
     global current_world
 
     # switch the references to the objects in the named context_map:
-    (_entity_count, _components, _entities, _dead_entities, _get_component_cache,
-     _get_components_cache, _processors, process_times, event_registry) = _context_map[name]
+    (_entity_count, _components, _entities, _dead_entities, _get_component_cache, _get_components_cache,
+     _get_components_cache_index, _processors, _processors_by_type, process_times,
+     event_registry) = _context_map[name]
     _current_world = current_world = name
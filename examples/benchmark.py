@@ -6,7 +6,7 @@ import sys
 import time
 import optparse
 
-from dataclasses import dataclass as component
+from dataclasses import dataclass
 
 import esper
 
@@ -30,9 +30,9 @@ if MAX_ENTITIES <= 500:
 
 if options.walltime:
     print("Benchmarking wall clock time...\n")
-    time_query = time.time
+    time_query = time.perf_counter_ns
 else:
-    time_query = time.process_time
+    time_query = time.process_time_ns
 
 
 ##########################
@@ -40,10 +40,13 @@ else:
 ##########################
 def timing(f):
     def wrap(*args):
+        # Keep the garbage collector from firing inside the timed call:
+        gc.disable()
         time1 = time_query()
         ret = f(*args)
         time2 = time_query()
-        result_times.append((time2 - time1)*1000.0)
+        gc.enable()
+        result_times.append((time2 - time1) / 1_000_000)
         return ret
     return wrap
 
@@ -51,6 +54,10 @@ def timing(f):
 #################################
 # Define some generic components:
 #################################
+# Slotted dataclasses are smaller, and have faster attribute access:
+component = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
 @component
 class Velocity:
     x: int = 0
@@ -94,9 +101,8 @@ class Brain:
 # Set up some dummy entities:
 #############################
 def create_entities(number):
-    for _ in range(number // 2):
-        esper.create_entity(Position(), Velocity(), Health(), Command())
-        esper.create_entity(Position(), Health(), Damageable())
+    esper.create_entities(number // 2, Position, Velocity, Health, Command)
+    esper.create_entities(number // 2, Position, Health, Damageable)
 
 
 #############################
@@ -128,6 +134,9 @@ result_times = []
 
 for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     create_entities(amount)
+    # Move the new Components out of the collector's generations:
+    gc.collect()
+    gc.freeze()
     for _ in range(50):
         single_comp_query()
 
@@ -136,10 +145,14 @@ for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     results[1][amount] = result_min
     result_times = []
     esper.clear_database()
+    gc.unfreeze()
     gc.collect()
 
 for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     create_entities(amount)
+    # Move the new Components out of the collector's generations:
+    gc.collect()
+    gc.freeze()
     for _ in range(50):
         two_comp_query()
 
@@ -148,10 +161,14 @@ for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     results[2][amount] = result_min
     result_times = []
     esper.clear_database()
+    gc.unfreeze()
     gc.collect()
 
 for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     create_entities(amount)
+    # Move the new Components out of the collector's generations:
+    gc.collect()
+    gc.freeze()
     for _ in range(50):
         three_comp_query()
 
@@ -160,6 +177,7 @@ for amount in range(500, MAX_ENTITIES, MAX_ENTITIES//50):
     results[3][amount] = result_min
     result_times = []
     esper.clear_database()
+    gc.unfreeze()
     gc.collect()
 
 
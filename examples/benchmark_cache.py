@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import gc
 import sys
 import time
 import optparse
 
-from dataclasses import dataclass as component
+from dataclasses import dataclass
 
 import esper
 
@@ -35,10 +36,13 @@ if MAX_ENTITIES <= 50:
 ##########################
 def timing(f):
     def wrap(*args):
-        time1 = time.process_time()
+        # Keep the garbage collector from firing inside the timed call:
+        gc.disable()
+        time1 = time.process_time_ns()
         ret = f(*args)
-        time2 = time.process_time()
-        current_run.append((time2 - time1) * 1000.0)
+        time2 = time.process_time_ns()
+        gc.enable()
+        current_run.append((time2 - time1) / 1_000_000)
         return ret
     return wrap
 
@@ -46,6 +50,10 @@ def timing(f):
 #################################
 # Define some generic components:
 #################################
+# Slotted dataclasses are smaller, and have faster attribute access:
+component = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
 @component
 class Velocity:
     x: float = 0.0
@@ -124,7 +132,12 @@ def query_entities():
 
 for current_pass in range(10):
     esper.clear_database()
+    gc.unfreeze()
+    gc.collect()
     create_entities(MAX_ENTITIES)
+    # Move the new Components out of the collector's generations:
+    gc.collect()
+    gc.freeze()
 
     print(f"Pass {current_pass + 1}...")
 
@@ -20,6 +20,45 @@ def test_create_entity():
     assert entity1 < entity2
 
 
+def test_create_entities():
+    entity1 = esper.create_entity()
+    entities = esper.create_entities(10)
+    entity2 = esper.create_entity()
+    assert len(entities) == 10
+    assert list(entities) == list(range(entity1 + 1, entity2))
+    assert all(esper.entity_exists(entity) for entity in entities)
+    assert len(esper.create_entities(0)) == 0
+    assert esper.create_entity() == entity2 + 1
+
+
+def test_create_entities_with_components():
+    assert len(esper.get_component(ComponentA)) == 0
+    entities = esper.create_entities(10, ComponentA, lambda: ComponentB())
+    assert len(esper.get_component(ComponentA)) == 10
+    assert len(esper.get_components(ComponentA, ComponentB)) == 10
+    for entity in entities:
+        assert esper.has_components(entity, ComponentA, ComponentB)
+    # Every Entity should get its own Component instances:
+    assert len({id(comp) for _, comp in esper.get_component(ComponentA)}) == 10
+
+
+def test_create_entities_factory_error_invalidates_cache():
+    esper.create_entity(ComponentA())
+    assert len(esper.get_component(ComponentA)) == 1
+    calls = []
+
+    def failing_factory():
+        calls.append(None)
+        if len(calls) == 3:
+            raise ValueError
+        return ComponentA()
+
+    with pytest.raises(ValueError):
+        esper.create_entities(5, failing_factory)
+    # The Entities created before the error must not be hidden by the cache:
+    assert len(esper.get_component(ComponentA)) == len(esper._components[ComponentA]) == 3
+
+
 def test_create_entity_with_components():
     entity1 = esper.create_entity(ComponentA())
     entity2 = esper.create_entity(ComponentB(), ComponentC())
@@ -101,7 +140,7 @@ def test_has_components():
 
 def test_get_component():
     create_entities(2000)
-    assert isinstance(esper.get_component(ComponentA), list)
+    assert isinstance(esper.get_component(ComponentA), tuple)
     # Confirm that the actually contains something:
     assert len(esper.get_component(ComponentA)) > 0, "No Components Returned"
 
@@ -112,13 +151,13 @@ def test_get_component():
 
 def test_get_two_components():
     create_entities(2000)
-    assert isinstance(esper.get_components(ComponentD, ComponentE), list)
+    assert isinstance(esper.get_components(ComponentD, ComponentE), tuple)
     # Confirm that the actually contains something:
     assert len(esper.get_components(ComponentD, ComponentE)) > 0, "No Components Returned"
 
     for ent, comps in esper.get_components(ComponentD, ComponentE):
         assert isinstance(ent, int)
-        assert isinstance(comps, list)
+        assert isinstance(comps, tuple)
         assert len(comps) == 2
 
     for ent, (d, e) in esper.get_components(ComponentD, ComponentE):
@@ -129,11 +168,11 @@ def test_get_two_components():
 
 def test_get_three_components():
     create_entities(2000)
-    assert isinstance(esper.get_components(ComponentC, ComponentD, ComponentE), list)
+    assert isinstance(esper.get_components(ComponentC, ComponentD, ComponentE), tuple)
 
     for ent, comps in esper.get_components(ComponentC, ComponentD, ComponentE):
         assert isinstance(ent, int)
-        assert isinstance(comps, list)
+        assert isinstance(comps, tuple)
         assert len(comps) == 3
 
     for ent, (c, d, e) in esper.get_components(ComponentC, ComponentD, ComponentE):
@@ -143,6 +182,16 @@ def test_get_three_components():
         assert isinstance(e, ComponentE)
 
 
+def test_get_components_single_type():
+    create_entities(2000)
+    assert len(esper.get_components(ComponentA)) == 1000
+
+    for ent, comps in esper.get_components(ComponentA):
+        assert isinstance(comps, tuple)
+        assert len(comps) == 1
+        assert comps[0] is esper.component_for_entity(ent, ComponentA)
+
+
 def test_try_component():
     entity1 = esper.create_entity(ComponentA(), ComponentB())
 
@@ -188,6 +237,27 @@ def test_cache_results():
     assert len(esper.get_components(ComponentB, ComponentC)) == 1
 
 
+def test_cache_invalidation_is_per_component_type():
+    entity = esper.create_entity(ComponentA(), ComponentB())
+    cached_a = esper.get_component(ComponentA)
+    cached_ab = esper.get_components(ComponentA, ComponentB)
+
+    # Unrelated Component types should leave the cached results alone:
+    esper.add_component(entity, ComponentC())
+    esper.remove_component(entity, ComponentC)
+    assert esper.get_component(ComponentA) is cached_a
+    assert esper.get_components(ComponentA, ComponentB) is cached_ab
+
+    # Any change to a queried type should invalidate them:
+    esper.create_entity(ComponentB())
+    assert esper.get_component(ComponentA) is cached_a
+    assert esper.get_components(ComponentA, ComponentB) is not cached_ab
+    esper.delete_entity(entity)
+    esper.clear_dead_entities()
+    assert len(esper.get_component(ComponentA)) == 0
+    assert len(esper.get_components(ComponentA, ComponentB)) == 0
+
+
 class TestEntityExists:
     def test_dead_entity(self):
         dead_entity = esper.create_entity(ComponentB())
@@ -366,6 +436,17 @@ def test_add_processor():
     assert isinstance(esper._processors[0], esper.Processor)
 
 
+def test_add_processor_priority_order():
+    processor_a = CorrectProcessorA()
+    processor_b = CorrectProcessorB()
+    processor_c = CorrectProcessorC()
+    esper.add_processor(processor_a, priority=1)
+    esper.add_processor(processor_b, priority=5)
+    esper.add_processor(processor_c, priority=1)
+    # Higher priorities first, and equal priorities in the order added:
+    assert esper._processors == [processor_b, processor_a, processor_c]
+
+
 def test_remove_processor():
     create_entities(2000)
     assert len(esper._processors) == 0
@@ -378,6 +459,27 @@ def test_remove_processor():
     assert len(esper._processors) == 0
 
 
+def test_remove_processor_removes_all_instances_of_type():
+    esper.add_processor(CorrectProcessorA())
+    esper.add_processor(CorrectProcessorA())
+    esper.add_processor(CorrectProcessorB())
+    esper.remove_processor(CorrectProcessorA)
+    assert len(esper._processors) == 1
+    assert esper.get_processor(CorrectProcessorA) is None
+    assert isinstance(esper.get_processor(CorrectProcessorB), CorrectProcessorB)
+
+
+def test_get_processor_returns_highest_priority_instance():
+    processor_low = CorrectProcessorA()
+    processor_high = CorrectProcessorA()
+    processor_equal = CorrectProcessorA()
+    esper.add_processor(processor_low, priority=0)
+    esper.add_processor(processor_high, priority=5)
+    esper.add_processor(processor_equal, priority=5)
+    assert esper._processors[0] is processor_high
+    assert esper.get_processor(CorrectProcessorA) is processor_high
+
+
 def test_get_processor():
     processor_a = CorrectProcessorA()
     processor_b = CorrectProcessorB()
@@ -395,6 +497,26 @@ def test_get_processor():
     assert type(retrieved_proc_c) == CorrectProcessorC
 
 
+def test_processor_removed_during_process():
+    class RemovingProcessor(esper.Processor):
+        def process(self):
+            esper.remove_processor(RemovingProcessor)
+
+    class CountingProcessor(esper.Processor):
+        calls = 0
+
+        def process(self):
+            self.calls += 1
+
+    counting_processor = CountingProcessor()
+    esper.add_processor(RemovingProcessor(), priority=1)
+    esper.add_processor(counting_processor)
+    esper.process()
+    # Removing a Processor should not cause its peers to be skipped:
+    assert counting_processor.calls == 1
+    assert len(esper._processors) == 1
+
+
 def test_processor_args():
     esper.add_processor(ArgsProcessor())
     with pytest.raises(TypeError):
@@ -439,6 +561,34 @@ def test_event_dispatch_incorrect_args():
     esper.event_registry.clear()
 
 
+def test_event_dispatch_handler_registers_handler():
+    def handler():
+        esper.set_handler("foo", myhandler_noargs)
+
+    esper.set_handler("foo", handler)
+    esper.dispatch_event("foo")
+    assert len(esper.event_registry["foo"]) == 2
+    esper.event_registry.clear()
+
+
+def test_event_dispatch_skips_dead_handler():
+    calls = []
+
+    def handler():
+        calls.append(None)
+
+    def dead_reference():
+        # A dead weak reference returns None when called:
+        return None
+
+    esper.set_handler("foo", handler)
+    # A dead reference that has not yet been removed from the registry:
+    esper.event_registry["foo"].add(dead_reference)
+    esper.dispatch_event("foo")
+    assert len(calls) == 1
+    esper.event_registry.clear()
+
+
 def test_set_methoad_as_handler_in_init():
 
     class MyClass(esper.Processor):